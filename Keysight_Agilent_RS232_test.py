@@ -41,36 +41,85 @@ instruments with visual status indicators showing pass/fail results for each tes
 """
 
 # %% Import General Modules
+import re
 import sys
 import time
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import functools
+import queue
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List, Tuple, Optional, Any, Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # %%% Import QtPy components
 try:
     from qtpy.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QGridLayout, QPushButton, QLabel,
-                               QTextEdit, QComboBox, QProgressBar, QGroupBox,
-                               QMessageBox, QFrame, QScrollArea, QTabWidget,
-                               QSpinBox, QDoubleSpinBox, QLineEdit)
-    from qtpy.QtCore import QThread, Signal, QTimer, Qt
-    from qtpy.QtGui import QFont, QPalette, QColor
+                               QTextEdit, QPlainTextEdit, QComboBox, QProgressBar,
+                               QGroupBox, QMessageBox, QFrame, QScrollArea, QTabWidget,
+                               QSpinBox, QDoubleSpinBox, QLineEdit, QTreeWidget,
+                               QTreeWidgetItem)
+    from qtpy.QtCore import (QThread, Signal, QTimer, Qt, QSignalBlocker,
+                             QMutex, QMutexLocker, QWaitCondition)
+    from qtpy.QtGui import QFont, QPalette, QColor, QBrush
 except ImportError:
     print("Error: QtPy not installed. Install with: pip install qtpy pyside6")
     sys.exit(1)
 
-# %%% Import PyVISA
-try:
-    import pyvisa
-    from pyvisa.errors import VisaIOError, InvalidBinaryFormat
-except ImportError:
-    print("Error: PyVISA not installed. Install with: pip install pyvisa")
-    sys.exit(1)
-
 # %% Class and Function Space
 
+_RM = None
+# Guards creation of _RM, which GUI and worker threads may request at once
+_RM_LOCK = threading.Lock()
+
+# Read chunk size for instrument sessions. Large chunks let NI-VISA finish
+# bulk (waveform/trace) reads in a single call; pyvisa-py gains little.
+VISA_CHUNK_SIZE = 1 << 20
+
+# Seconds a VISA resource listing is reused before interfaces are re-probed
+RESOURCE_CACHE_TTL = 5.0
+
+# Lines kept in the log view; the complete log is in instrument_test.log
+LOG_MAX_LINES = 5000
+
+# Pre-encoded queries for the timing loops (written with write_raw)
+IDN_BYTES = b"*IDN?\n"
+STABILITY_COMMANDS = ["*IDN?", "*STB?", "*ESR?", "*OPC?"]
+STABILITY_COMMANDS_BYTES = [cmd.encode("ascii") + b"\n" for cmd in STABILITY_COMMANDS]
+
+# Manufacturer names accepted as Agilent/Keysight in an *IDN? reply
+_BRAND_RE = re.compile(r"agilent|keysight|hewlett-packard|\bhp\b", re.IGNORECASE)
+
+# Entries of a SCPI error queue reply, e.g. -113,"Undefined header"
+_SCPI_ERROR_RE = re.compile(r'[-+]?\d+,"[^"]*"')
+_NO_ERROR_PREFIXES = ("0,", "+0,")
+
+# VISA errors after which a session cannot recover (cable pulled, instrument
+# power-cycled); the tester drops the session and reopens it for the next test
+_SESSION_LOST_ERRORS = frozenset(("VI_ERROR_CONN_LOST", "VI_ERROR_IO",
+                                  "VI_ERROR_INV_OBJECT", "VI_ERROR_RSRC_NFOUND"))
+
+def get_rm():
+    """
+    Return the shared VISA resource manager.
+    The manager is created on first use and lives for the process lifetime;
+    only instrument sessions are closed after use. PyVISA is imported here
+    rather than at startup so the window opens without loading it.
+    """
+    global _RM
+    if _RM is None:
+        with _RM_LOCK:
+            if _RM is None:
+                try:
+                    import pyvisa
+                except ImportError:
+                    raise ImportError("PyVISA not installed. Install with: pip install pyvisa")
+                _RM = pyvisa.ResourceManager()
+    return _RM
+
 @dataclass
 class TestResult:
     """Data class to store test results."""
@@ -80,10 +129,45 @@ class TestResult:
     execution_time: float
     timestamp: datetime
 
+@dataclass
+class TestRunSummary:
+    """Data class summarizing one run of queued tests."""
+    passed: int
+    failed: int
+    total: int
+    duration: float
+
+def _timed_test(test_name: str, error_prefix: str = "Failed"):
+    """
+    Decorator for InstrumentTester test methods.
+    The decorated method returns (passed, message); the wrapper times it and
+    builds the TestResult, turning any exception into a failed result.
+    """
+    def decorator(test_method):
+        @functools.wraps(test_method)
+        def wrapper(self) -> TestResult:
+            # One wall-clock read per test, taken when the test starts
+            timestamp = datetime.now()
+            start_ns = time.perf_counter_ns()
+            try:
+                passed, message = test_method(self)
+            except Exception as e:
+                passed, message = False, f"{error_prefix}: {str(e)}"
+            return TestResult(
+                test_name=test_name,
+                passed=passed,
+                message=message,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
+                timestamp=timestamp
+            )
+        return wrapper
+    return decorator
+
 class SignalGeneratorWorker(QThread):
     """
     Worker thread for signal generator operations.
-    Performs RF and device power operations asynchronously.
+    Performs RF and device power operations asynchronously, holding the
+    test worker's I/O lock so the two never talk to the port at once.
     """
 
     # Signals for communication with main thread
@@ -91,10 +175,12 @@ class SignalGeneratorWorker(QThread):
     operation_started = Signal(str)
     log_message = Signal(str)
 
-    def __init__(self, resource_address: str, operation: str, **kwargs):
+    def __init__(self, resource_address: str, operation: str,
+                 io_lock: Optional[threading.Lock] = None, **kwargs):
         super().__init__()
         self.resource_address = resource_address
         self.operation = operation
+        self.io_lock = io_lock if io_lock is not None else threading.Lock()
         self.kwargs = kwargs
         self.instrument = None
         self.rm = None
@@ -103,31 +189,33 @@ class SignalGeneratorWorker(QThread):
         """Execute the signal generator operation."""
         self.operation_started.emit(self.operation)
 
-        try:
-            # Initialize VISA resource manager
-            self.rm = pyvisa.ResourceManager()
-            # Connect to instrument
-            self.instrument = self.rm.open_resource(self.resource_address)
-            self.instrument.timeout = 5000  # 5 second timeout
+        # Tester I/O waits until this operation has closed its session
+        with self.io_lock:
+            try:
+                # Use the shared VISA resource manager
+                self.rm = get_rm()
+                # Connect to instrument
+                self.instrument = self.rm.open_resource(self.resource_address)
+                self.instrument.timeout = 5000  # 5 second timeout
 
-            result = self._execute_operation()
-            self.operation_completed.emit(result)
+                result = self._execute_operation()
+                self.operation_completed.emit(result)
 
-        except Exception as e:
-            error_result = TestResult(
-                test_name=self.operation,
-                passed=False,
-                message=f"Operation failed: {str(e)}",
-                execution_time=0.0,
-                timestamp=datetime.now()
-            )
-            self.operation_completed.emit(error_result)
-        finally:
-            self._cleanup()
+            except Exception as e:
+                error_result = TestResult(
+                    test_name=self.operation,
+                    passed=False,
+                    message=f"Operation failed: {str(e)}",
+                    execution_time=0.0,
+                    timestamp=datetime.now()
+                )
+                self.operation_completed.emit(error_result)
+            finally:
+                self._cleanup()
 
     def _execute_operation(self) -> TestResult:
         """Execute the specific signal generator operation."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             if self.operation == "RF Power ON":
@@ -143,7 +231,7 @@ class SignalGeneratorWorker(QThread):
                     test_name=self.operation,
                     passed=False,
                     message="Unknown operation",
-                    execution_time=time.time() - start_time,
+                    execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                     timestamp=datetime.now()
                 )
         except Exception as e:
@@ -151,13 +239,13 @@ class SignalGeneratorWorker(QThread):
                 test_name=self.operation,
                 passed=False,
                 message=f"Operation failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
     def _turn_on_rf(self) -> TestResult:
         """Turn on RF power output."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Get current settings or use defaults
@@ -175,7 +263,7 @@ class SignalGeneratorWorker(QThread):
             for cmd in rf_commands:
                 try:
                     self.instrument.write(cmd)
-                    time.sleep(0.5)  # Wait for command to execute
+                    QThread.msleep(500)  # Wait for command to execute
 
                     # Try to verify output is on
                     try:
@@ -208,7 +296,7 @@ class SignalGeneratorWorker(QThread):
                 test_name="RF Power ON",
                 passed=rf_turned_on,
                 message=message,
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
@@ -217,13 +305,13 @@ class SignalGeneratorWorker(QThread):
                 test_name="RF Power ON",
                 passed=False,
                 message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
     def _turn_off_rf(self) -> TestResult:
         """Turn off RF power output."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Try multiple RF output OFF commands for compatibility
@@ -233,7 +321,7 @@ class SignalGeneratorWorker(QThread):
             for cmd in rf_commands:
                 try:
                     self.instrument.write(cmd)
-                    time.sleep(0.5)  # Wait for command to execute
+                    QThread.msleep(500)  # Wait for command to execute
 
                     # Try to verify output is off
                     try:
@@ -263,7 +351,7 @@ class SignalGeneratorWorker(QThread):
                 test_name="RF Power OFF",
                 passed=rf_turned_off,
                 message=message,
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
@@ -272,13 +360,13 @@ class SignalGeneratorWorker(QThread):
                 test_name="RF Power OFF",
                 passed=False,
                 message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
     def _turn_on_device(self) -> TestResult:
         """Turn on the device (if supported)."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Clear any errors first
@@ -299,7 +387,7 @@ class SignalGeneratorWorker(QThread):
                 test_name="Device ON",
                 passed=passed,
                 message=message,
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
@@ -308,13 +396,13 @@ class SignalGeneratorWorker(QThread):
                 test_name="Device ON",
                 passed=False,
                 message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
     def _turn_off_device(self) -> TestResult:
         """Turn off the device (if supported)."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # First turn off RF output for safety
@@ -331,7 +419,7 @@ class SignalGeneratorWorker(QThread):
                 test_name="Device OFF",
                 passed=True,  # Consider success since we disabled RF
                 message=message,
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
@@ -340,7 +428,7 @@ class SignalGeneratorWorker(QThread):
                 test_name="Device OFF",
                 passed=False,
                 message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9,
                 timestamp=datetime.now()
             )
 
@@ -349,8 +437,6 @@ class SignalGeneratorWorker(QThread):
         try:
             if self.instrument:
                 self.instrument.close()
-            if self.rm:
-                self.rm.close()
         except:
             pass
 
@@ -358,6 +444,9 @@ class InstrumentTester(QThread):
     """
     Worker thread for instrument testing operations.
     Performs tests asynchronously to keep GUI responsive.
+    The thread stays alive between runs and keeps the instrument session
+    open, taking test names from a queue until stop() is called. A session
+    lost to a connection error is reopened for the next test.
     """
 
     # Signals for communication with main thread
@@ -365,43 +454,211 @@ class InstrumentTester(QThread):
     test_started = Signal(str)
     progress_updated = Signal(int)
     log_message = Signal(str)
+    tests_finished = Signal(object)  # TestRunSummary
+
+    # Test name -> test method
+    _DISPATCH = {
+        "Connection Test": "_test_connection",
+        "Identification": "_test_identification",
+        "Self Test": "_test_self_test",
+        "Reset Command": "_test_reset",
+        "Error Status": "_test_error_status",
+        "Status Registers": "_test_status_registers",
+        "Operation Complete": "_test_operation_complete",
+        "Response Time": "_test_response_time",
+        "Communication Stability": "_test_communication_stability",
+        "SCPI Compliance": "_test_scpi_compliance",
+    }
 
     def __init__(self, resource_address: str):
         super().__init__()
         self.resource_address = resource_address
         self.instrument = None
         self.rm = None
-        self.tests_to_run = []
+        # Pending tests in run order; keys make re-queued tests collapse
+        self.tests_to_run = OrderedDict()
+        # Guards tests_to_run and the flags below; the worker sleeps on
+        # _wake until there is work, a stop request, or a pacing timeout
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._stop_requested = False
+        # Set by cancel() and cleared when the next test is taken
+        self._cancel_requested = False
+        self._busy = False
+        self._reopen = False
+        # Set by the I/O helpers when the session is lost
+        self._session_lost = False
+        # Serializes instrument I/O so replies cannot interleave across
+        # threads; shared with SignalGeneratorWorker, which uses the same port
+        self.io_lock = threading.Lock()
+        # Per-session capabilities, set in _open_instrument
+        self.supports_batching = False
+        self._supports_err_count = None
 
     def add_test(self, test_name: str):
-        """Add a test to the queue."""
-        self.tests_to_run.append(test_name)
+        """Add a test to the queue; a test already pending is not added twice."""
+        with QMutexLocker(self._mutex):
+            self.tests_to_run[test_name] = None
+            self._wake.wakeAll()
 
-    def run(self):
-        """Execute all queued tests."""
-        if not self.tests_to_run:
-            return
+    def reset(self, resource_address: str, test_names: Iterable[str] = ()):
+        """
+        Point the worker at resource_address and replace the pending tests.
+        A changed address closes the current session before the next test.
+        """
+        with QMutexLocker(self._mutex):
+            if resource_address != self.resource_address:
+                self.resource_address = resource_address
+                self._reopen = True
+            self.tests_to_run.clear()
+            for test_name in test_names:
+                self.tests_to_run[test_name] = None
+            self._wake.wakeAll()
+
+    def set_address(self, resource_address: str):
+        """Point the worker at resource_address, keeping the pending tests."""
+        with QMutexLocker(self._mutex):
+            if resource_address != self.resource_address:
+                self.resource_address = resource_address
+                self._reopen = True
+
+    def invalidate(self, test_name: str):
+        """Remove a pending test whose result is no longer wanted."""
+        with QMutexLocker(self._mutex):
+            self.tests_to_run.pop(test_name, None)
+
+    def clear_pending(self):
+        """Drop queued tests; the test in progress runs to completion."""
+        with QMutexLocker(self._mutex):
+            self.tests_to_run.clear()
+
+    def cancel(self):
+        """Drop queued tests and cut short any pause in the test in progress."""
+        with QMutexLocker(self._mutex):
+            self.tests_to_run.clear()
+            self._cancel_requested = True
+            self._wake.wakeAll()
+
+    def is_busy(self) -> bool:
+        """Return True while queued tests are being processed."""
+        return self._busy or bool(self.tests_to_run)
+
+    def stop(self):
+        """Ask the worker to finish the current test and exit."""
+        with QMutexLocker(self._mutex):
+            self._stop_requested = True
+            self._wake.wakeAll()
+
+    def release_session(self):
+        """
+        Close the instrument session so another worker can open the port.
+        Call only while the tester is idle; the next test reopens it.
+        """
+        with self.io_lock:
+            self._cleanup()
 
-        try:
-            # Initialize VISA resource manager
-            self.rm = pyvisa.ResourceManager()
-            # Connect to instrument
-            self.instrument = self.rm.open_resource(self.resource_address)
-            self.instrument.timeout = 5000  # 5 second timeout
+    def _pause(self, ms: int):
+        """Wait up to ms milliseconds, returning early on stop() or cancel()."""
+        end_ns = time.perf_counter_ns() + ms * 1_000_000
+        with QMutexLocker(self._mutex):
+            while not (self._stop_requested or self._cancel_requested):
+                remaining_ms = (end_ns - time.perf_counter_ns()) // 1_000_000
+                if remaining_ms <= 0:
+                    break
+                self._wake.wait(self._mutex, remaining_ms)
 
-            total_tests = len(self.tests_to_run)
-            for i, test_name in enumerate(self.tests_to_run):
-                self.test_started.emit(test_name)
-                result = self._execute_test(test_name)
-                self.test_completed.emit(result)
+    def run(self):
+        """Execute queued tests until stop() is called."""
+        # Per-run state, reset whenever the queue drains
+        completed = 0
+        passed = 0
+        failed = 0
+        run_start_ns = None
+        last_progress = -1
 
-                # Update progress
-                progress = int((i + 1) * 100 / total_tests)
-                self.progress_updated.emit(progress)
+        try:
+            while True:
+                with QMutexLocker(self._mutex):
+                    while not self.tests_to_run and not self._stop_requested:
+                        self._wake.wait(self._mutex)
+                    if self._stop_requested:
+                        break
+                    test_name, _ = self.tests_to_run.popitem(last=False)
+                    # Tests queued after cancel() pace normally again
+                    self._cancel_requested = False
+                    self._busy = True
+                    if run_start_ns is None:
+                        run_start_ns = time.perf_counter_ns()
+                    reopen = self._reopen
+                    self._reopen = False
+
+                if reopen:
+                    self._cleanup()
+
+                # Open the instrument on first use and keep it open
+                if self.instrument is None and not self._open_instrument():
+                    failed += 1
+                    self.clear_pending()
+                else:
+                    self.test_started.emit(test_name)
+                    result = self._execute_test(test_name)
+                    self.test_completed.emit(result)
+                    # Reopen a lost session, or one that failed the
+                    # Connection Test, before the next test
+                    if self._session_lost or (test_name == "Connection Test"
+                                              and not result.passed):
+                        self._cleanup()
+                    if result.passed:
+                        passed += 1
+                    else:
+                        failed += 1
+
+                    # Update progress over the tests queued so far
+                    completed += 1
+                    remaining = len(self.tests_to_run)
+                    progress = int(completed * 100 / (completed + remaining))
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.progress_updated.emit(progress)
+
+                with QMutexLocker(self._mutex):
+                    drained = not self.tests_to_run
+                    if drained:
+                        self._busy = False
+                if drained:
+                    self.tests_finished.emit(TestRunSummary(
+                        passed=passed,
+                        failed=failed,
+                        total=passed + failed,
+                        duration=(time.perf_counter_ns() - run_start_ns) * 1e-9
+                    ))
+                    completed = passed = failed = 0
+                    run_start_ns = None
+                    last_progress = -1
+        finally:
+            self._cleanup()
 
-                time.sleep(0.1)  # Brief pause between tests
+    def _open_instrument(self) -> bool:
+        """Open the instrument session, reporting a failed connection."""
+        try:
+            # Use the shared VISA resource manager
+            self.rm = get_rm()
+            # Connect to instrument, waiting out any SigGen operation
+            with self.io_lock:
+                self.instrument = self.rm.open_resource(self.resource_address)
+            self.instrument.timeout = 5000  # 5 second timeout
+            self.instrument.chunk_size = VISA_CHUNK_SIZE
+            self.instrument.read_termination = "\n"
+            # Compound SCPI commands ("*STB?;*ESR?") cut round trips but raw
+            # SOCKET sessions may not return multiple replies in one read
+            self.supports_batching = self.resource_address.strip().upper().endswith("INSTR")
+            # SYST:ERR:COUN?/SYST:ERR:ALL? support, None until first probed
+            self._supports_err_count = None
+            self._session_lost = False
+            return True
 
         except Exception as e:
+            self.instrument = None
             error_result = TestResult(
                 test_name="Connection",
                 passed=False,
@@ -410,385 +667,310 @@ class InstrumentTester(QThread):
                 timestamp=datetime.now()
             )
             self.test_completed.emit(error_result)
-        finally:
-            self._cleanup()
+            return False
+
+    def _q(self, cmd: str) -> str:
+        """Query the instrument while holding the I/O lock."""
+        with self.io_lock:
+            try:
+                return self.instrument.query(cmd)
+            except Exception as e:
+                self._check_session(e)
+                raise
+
+    def _w(self, cmd: str):
+        """Write to the instrument while holding the I/O lock."""
+        with self.io_lock:
+            try:
+                self.instrument.write(cmd)
+            except Exception as e:
+                self._check_session(e)
+                raise
+
+    def _q_raw(self, cmd: bytes) -> bytes:
+        """Write pre-encoded bytes and read the raw reply under the I/O lock."""
+        with self.io_lock:
+            try:
+                self.instrument.write_raw(cmd)
+                return self.instrument.read_raw()
+            except Exception as e:
+                self._check_session(e)
+                raise
+
+    def _check_session(self, error: Exception):
+        """Flag the session as lost after a connection-level I/O error."""
+        # pyserial's SerialException (pyvisa-py ASRL) is an OSError
+        if (isinstance(error, OSError)
+                or getattr(error, "abbreviation", None) in _SESSION_LOST_ERRORS):
+            self._session_lost = True
 
     def _execute_test(self, test_name: str) -> TestResult:
         """Execute a specific test and return the result."""
-        start_time = time.time()
-
-        try:
-            if test_name == "Connection Test":
-                return self._test_connection()
-            elif test_name == "Identification":
-                return self._test_identification()
-            elif test_name == "Self Test":
-                return self._test_self_test()
-            elif test_name == "Reset Command":
-                return self._test_reset()
-            elif test_name == "Error Status":
-                return self._test_error_status()
-            elif test_name == "Status Registers":
-                return self._test_status_registers()
-            elif test_name == "Operation Complete":
-                return self._test_operation_complete()
-            elif test_name == "Response Time":
-                return self._test_response_time()
-            elif test_name == "Communication Stability":
-                return self._test_communication_stability()
-            elif test_name == "SCPI Compliance":
-                return self._test_scpi_compliance()
-            else:
-                return TestResult(
-                    test_name=test_name,
-                    passed=False,
-                    message="Unknown test",
-                    execution_time=time.time() - start_time,
-                    timestamp=datetime.now()
-                )
-        except Exception as e:
+        method_name = self._DISPATCH.get(test_name)
+        if method_name is None:
             return TestResult(
                 test_name=test_name,
                 passed=False,
-                message=f"Test failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                message="Unknown test",
+                execution_time=0.0,
                 timestamp=datetime.now()
             )
 
-    def _test_connection(self) -> TestResult:
+        # Test methods are wrapped by _timed_test, which already converts
+        # exceptions into a failed result with its own timestamp
+        return getattr(self, method_name)()
+
+    @_timed_test("Connection Test", error_prefix="Connection failed")
+    def _test_connection(self) -> Tuple[bool, str]:
         """Test basic connection to instrument."""
-        start_time = time.time()
-        try:
-            # Try a simple query
-            response = self.instrument.query("*IDN?")
-            passed = len(response.strip()) > 0
-            message = f"Connected successfully. Response: {response[:50]}..." if passed else "No response"
+        # Try a simple query
+        response = self._q("*IDN?")
+        passed = len(response.strip()) > 0
+        message = f"Connected successfully. Response: {response[:50]}..." if passed else "No response"
 
-            return TestResult(
-                test_name="Connection Test",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Connection Test",
-                passed=False,
-                message=f"Connection failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_identification(self) -> TestResult:
+    @_timed_test("Identification")
+    def _test_identification(self) -> Tuple[bool, str]:
         """Test instrument identification query."""
-        start_time = time.time()
-        try:
-            idn_response = self.instrument.query("*IDN?").strip()
+        idn_response = self._q("*IDN?").strip()
 
-            # Check if response contains expected Agilent/Keysight identifiers
-            is_agilent_keysight = any(brand.lower() in idn_response.lower()
-                                    for brand in ["agilent", "keysight", "hewlett-packard", "hp"])
+        # Check if response contains expected Agilent/Keysight identifiers
+        is_agilent_keysight = bool(_BRAND_RE.search(idn_response))
 
-            message = f"ID: {idn_response}"
-            if not is_agilent_keysight:
-                message += " (Warning: Not recognized as Agilent/Keysight device)"
+        message = f"ID: {idn_response}"
+        if not is_agilent_keysight:
+            message += " (Warning: Not recognized as Agilent/Keysight device)"
 
-            return TestResult(
-                test_name="Identification",
-                passed=len(idn_response) > 0,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Identification",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return len(idn_response) > 0, message
 
-    def _test_self_test(self) -> TestResult:
+    @_timed_test("Self Test")
+    def _test_self_test(self) -> Tuple[bool, str]:
         """Test instrument self-test capability."""
-        start_time = time.time()
-        try:
-            # Send self-test command and get result
-            self.instrument.write("*TST")
-            time.sleep(1)  # Wait for self-test to complete
+        # Send self-test command and get result
+        self._w("*TST")
+        self._q("*OPC?")  # Block until self-test completes
 
-            # Query the result
-            result = self.instrument.query("*TST?").strip()
+        # Query the result
+        result = self._q("*TST?").strip()
 
-            # Result should be "0" for pass
-            passed = result == "0"
-            message = f"Self-test result: {result} ({'PASS' if passed else 'FAIL'})"
+        # Result should be "0" for pass
+        passed = result == "0"
+        message = f"Self-test result: {result} ({'PASS' if passed else 'FAIL'})"
 
-            return TestResult(
-                test_name="Self Test",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Self Test",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_reset(self) -> TestResult:
+    @_timed_test("Reset Command")
+    def _test_reset(self) -> Tuple[bool, str]:
         """Test instrument reset command."""
-        start_time = time.time()
-        try:
-            # Send reset command
-            self.instrument.write("*RST")
-            time.sleep(2)  # Wait for reset to complete
+        # Send reset command, *OPC? returns once the reset has completed
+        self._q("*RST;*OPC?")
 
-            # Verify instrument is responsive after reset
-            response = self.instrument.query("*IDN?").strip()
-            passed = len(response) > 0
-            message = f"Reset {'successful' if passed else 'failed'}"
+        # Verify instrument is responsive after reset
+        response = self._q("*IDN?").strip()
+        passed = len(response) > 0
+        message = f"Reset {'successful' if passed else 'failed'}"
 
-            return TestResult(
-                test_name="Reset Command",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Reset Command",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_error_status(self) -> TestResult:
+    @_timed_test("Error Status")
+    def _test_error_status(self) -> Tuple[bool, str]:
         """Test error status checking."""
-        start_time = time.time()
-        try:
-            # Clear any existing errors
-            self.instrument.write("*CLS")
+        from pyvisa.errors import VisaIOError  # loaded by get_rm() already
 
-            # Check system error queue
+        # Clear any existing errors
+        self._w("*CLS")
+
+        # Check system error queue, in one or two transactions when the
+        # instrument supports the error count/drain-all queries
+        errors = None
+        count = 0
+        if self._supports_err_count is not False:
+            try:
+                count = int(self._q("SYST:ERR:COUN?").strip())
+                self._supports_err_count = True
+            except (VisaIOError, ValueError):
+                self._supports_err_count = False
+                # Discard the error raised by the unsupported query
+                self._w("*CLS")
+
+            if count == 0 and self._supports_err_count:
+                errors = []
+            elif count > 0:
+                try:
+                    reply = self._q("SYST:ERR:ALL?").strip()
+                    errors = [e for e in _SCPI_ERROR_RE.findall(reply)
+                              if not e.startswith(_NO_ERROR_PREFIXES)] or [reply]
+                except VisaIOError:
+                    pass  # Drain one entry at a time below; count is the floor
+
+        if errors is None:
             errors = []
             for _ in range(10):  # Check up to 10 errors
                 try:
-                    error = self.instrument.query("SYST:ERR?").strip()
-                    if error.startswith("0,") or error.startswith("+0,"):
+                    error = self._q("SYST:ERR?").strip()
+                    if error.startswith(_NO_ERROR_PREFIXES):
                         break  # No more errors
                     errors.append(error)
                 except:
                     break
 
-            passed = len(errors) == 0
-            message = f"No errors found" if passed else f"Errors: {'; '.join(errors[:3])}"
+        passed = len(errors) == 0 and count == 0
+        if passed:
+            message = f"No errors found"
+        elif errors:
+            message = f"Errors: {'; '.join(errors[:3])}"
+        else:
+            message = f"Errors: {count} reported by SYST:ERR:COUN?"
 
-            return TestResult(
-                test_name="Error Status",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Error Status",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_status_registers(self) -> TestResult:
+    @_timed_test("Status Registers")
+    def _test_status_registers(self) -> Tuple[bool, str]:
         """Test status register queries."""
-        start_time = time.time()
-        try:
-            # Query various status registers
-            stb = self.instrument.query("*STB?").strip()
-            esr = self.instrument.query("*ESR?").strip()
+        # Query various status registers
+        if self.supports_batching:
+            stb, esr = (reg.strip() for reg in
+                        self._q("*STB?;*ESR?").strip().split(";"))
+        else:
+            stb = self._q("*STB?").strip()
+            esr = self._q("*ESR?").strip()
 
-            passed = True
-            message = f"STB: {stb}, ESR: {esr}"
+        passed = True
+        message = f"STB: {stb}, ESR: {esr}"
 
-            return TestResult(
-                test_name="Status Registers",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Status Registers",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_operation_complete(self) -> TestResult:
+    @_timed_test("Operation Complete")
+    def _test_operation_complete(self) -> Tuple[bool, str]:
         """Test operation complete functionality."""
-        start_time = time.time()
-        try:
-            # Send operation complete command
-            self.instrument.write("*OPC")
+        # Send operation complete command
+        self._w("*OPC")
 
-            # Query operation complete status
-            opc_result = self.instrument.query("*OPC?").strip()
-            passed = opc_result == "1"
-            message = f"OPC result: {opc_result}"
+        # Query operation complete status
+        opc_result = self._q("*OPC?").strip()
+        passed = opc_result == "1"
+        message = f"OPC result: {opc_result}"
 
-            return TestResult(
-                test_name="Operation Complete",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Operation Complete",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_response_time(self) -> TestResult:
+    @_timed_test("Response Time")
+    def _test_response_time(self) -> Tuple[bool, str]:
         """Test instrument response time."""
-        start_time = time.time()
-        try:
-            response_times = []
+        response_times = []  # nanoseconds
 
-            # Perform multiple queries and measure response time
-            for _ in range(5):
-                query_start = time.time()
-                self.instrument.query("*IDN?")
-                query_time = time.time() - query_start
-                response_times.append(query_time)
+        # Perform multiple queries and measure response time
+        for _ in range(5):
+            query_start_ns = time.perf_counter_ns()
+            self._q_raw(IDN_BYTES)
+            response_times.append(time.perf_counter_ns() - query_start_ns)
 
-            avg_response_time = sum(response_times) / len(response_times)
-            max_response_time = max(response_times)
+        avg_ns = sum(response_times) / len(response_times)
+        max_ns = max(response_times)
 
-            # Consider pass if average response time is under 1 second
-            passed = avg_response_time < 1.0
-            message = f"Avg: {avg_response_time:.3f}s, Max: {max_response_time:.3f}s"
+        # Consider pass if average response time is under 1 second
+        passed = avg_ns < 1_000_000_000
+        message = f"Avg: {avg_ns * 1e-9:.3f}s, Max: {max_ns * 1e-9:.3f}s"
 
-            return TestResult(
-                test_name="Response Time",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Response Time",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
-    def _test_communication_stability(self) -> TestResult:
+    @_timed_test("Communication Stability")
+    def _test_communication_stability(self) -> Tuple[bool, str]:
         """Test communication stability with multiple commands."""
-        start_time = time.time()
-        try:
-            successful_commands = 0
-            total_commands = 10
-            commands = ["*IDN?", "*STB?", "*ESR?", "*OPC?"]
+        successful_commands = 0
+        attempted_commands = 0
+        total_commands = 10
+        required_rate = 0.9  # 90% success rate required
 
-            for i in range(total_commands):
-                try:
-                    cmd = commands[i % len(commands)]
-                    response = self.instrument.query(cmd)
-                    if response.strip():
-                        successful_commands += 1
-                except:
-                    pass
-                time.sleep(0.1)
+        for i in range(total_commands):
+            attempted_commands += 1
+            try:
+                cmd = STABILITY_COMMANDS_BYTES[i % len(STABILITY_COMMANDS_BYTES)]
+                response = self._q_raw(cmd)
+                if response.strip():
+                    successful_commands += 1
+            except:
+                pass
 
-            success_rate = successful_commands / total_commands
-            passed = success_rate >= 0.9  # 90% success rate required
-            message = f"Success rate: {success_rate:.1%} ({successful_commands}/{total_commands})"
+            # Stop as soon as the remaining commands cannot change the outcome
+            max_possible = successful_commands + (total_commands - attempted_commands)
+            if (successful_commands / total_commands >= required_rate
+                    or max_possible / total_commands < required_rate):
+                break
 
-            return TestResult(
-                test_name="Communication Stability",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="Communication Stability",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        passed = successful_commands / total_commands >= required_rate
+        success_rate = successful_commands / attempted_commands
+        message = f"Success rate: {success_rate:.1%} ({successful_commands}/{attempted_commands})"
 
-    def _test_scpi_compliance(self) -> TestResult:
+        return passed, message
+
+    @_timed_test("SCPI Compliance")
+    def _test_scpi_compliance(self) -> Tuple[bool, str]:
         """Test basic SCPI compliance."""
-        start_time = time.time()
-        try:
-            compliant_commands = 0
-            total_commands = 0
+        compliant_commands = 0
+        total_commands = 0
 
-            # Test mandatory SCPI commands
-            mandatory_commands = ["*IDN?", "*RST", "*CLS", "*ESR?", "*STB?", "*OPC?"]
+        # Test mandatory SCPI commands
+        mandatory_commands = ["*IDN?", "*RST", "*CLS", "*ESR?", "*STB?", "*OPC?"]
 
+        if self.supports_batching:
+            # Single compound command, one reply per query in the chain
+            batched_commands = ["*CLS", "*RST", "*IDN?", "*ESR?", "*STB?", "*OPC?"]
+            total_commands = len(batched_commands)
+            query_count = sum(1 for cmd in batched_commands if cmd.endswith("?"))
+            try:
+                response = self._q(";".join(batched_commands))
+                replies = [r for r in response.strip().split(";") if r.strip()]
+                compliant_commands = (total_commands - query_count
+                                      + min(len(replies), query_count))
+            except:
+                pass
+        else:
             for cmd in mandatory_commands:
                 total_commands += 1
                 try:
                     if cmd.endswith("?"):
-                        response = self.instrument.query(cmd)
+                        response = self._q(cmd)
                         if response.strip():
                             compliant_commands += 1
                     else:
-                        self.instrument.write(cmd)
+                        self._w(cmd)
                         compliant_commands += 1
-                    time.sleep(0.5)
+                    self._pause(500)
                 except:
                     pass
 
-            compliance_rate = compliant_commands / total_commands
-            passed = compliance_rate >= 0.8  # 80% compliance required
-            message = f"SCPI compliance: {compliance_rate:.1%} ({compliant_commands}/{total_commands})"
+        compliance_rate = compliant_commands / total_commands
+        passed = compliance_rate >= 0.8  # 80% compliance required
+        message = f"SCPI compliance: {compliance_rate:.1%} ({compliant_commands}/{total_commands})"
 
-            return TestResult(
-                test_name="SCPI Compliance",
-                passed=passed,
-                message=message,
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="SCPI Compliance",
-                passed=False,
-                message=f"Failed: {str(e)}",
-                execution_time=time.time() - start_time,
-                timestamp=datetime.now()
-            )
+        return passed, message
 
     def _cleanup(self):
         """Clean up resources."""
         try:
             if self.instrument:
                 self.instrument.close()
-            if self.rm:
-                self.rm.close()
         except:
             pass
+        self.instrument = None
+
+class ResourceListerThread(QThread):
+    """
+    Worker thread that lists available VISA resources.
+    Probing GPIB/USB/TCPIP interfaces can block for seconds, so it runs off
+    the GUI thread.
+    """
+
+    found = Signal(list)
+    failed = Signal(str)
+
+    def run(self):
+        """List VISA resources on the shared resource manager."""
+        try:
+            self.found.emit(list(get_rm().list_resources()))
+        except Exception as e:
+            self.failed.emit(str(e))
 
 class TestButton(QPushButton):
     """
@@ -796,6 +978,54 @@ class TestButton(QPushButton):
     Changes color based on test results (green=pass, red=fail, gray=not run).
     """
 
+    _BASE_STYLE = """
+        QPushButton {
+            border: 2px solid;
+            border-radius: 8px;
+            padding: 8px;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            opacity: 0.8;
+        }
+        QPushButton:pressed {
+            border-width: 3px;
+        }
+    """
+
+    # Full stylesheet per status, built once at class definition
+    _STYLES: Dict[str, str] = {
+        "pass": _BASE_STYLE + """
+            QPushButton {
+                background-color: #4CAF50;
+                border-color: #45a049;
+                color: white;
+            }
+        """,
+        "fail": _BASE_STYLE + """
+            QPushButton {
+                background-color: #f44336;
+                border-color: #da190b;
+                color: white;
+            }
+        """,
+        "running": _BASE_STYLE + """
+            QPushButton {
+                background-color: #ff9800;
+                border-color: #f57c00;
+                color: white;
+            }
+        """,
+        "idle": _BASE_STYLE + """
+            QPushButton {
+                background-color: #e0e0e0;
+                border-color: #bdbdbd;
+                color: black;
+            }
+        """,
+    }
+
     def __init__(self, test_name: str):
         super().__init__(test_name)
         self.test_name = test_name
@@ -807,55 +1037,8 @@ class TestButton(QPushButton):
         self.setStyleSheet(self._get_style(status))
 
     def _get_style(self, status: str) -> str:
-        """Get stylesheet for the given status."""
-        base_style = """
-            QPushButton {
-                border: 2px solid;
-                border-radius: 8px;
-                padding: 8px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                opacity: 0.8;
-            }
-            QPushButton:pressed {
-                border-width: 3px;
-            }
-        """
-
-        if status == "pass":
-            return base_style + """
-                QPushButton {
-                    background-color: #4CAF50;
-                    border-color: #45a049;
-                    color: white;
-                }
-            """
-        elif status == "fail":
-            return base_style + """
-                QPushButton {
-                    background-color: #f44336;
-                    border-color: #da190b;
-                    color: white;
-                }
-            """
-        elif status == "running":
-            return base_style + """
-                QPushButton {
-                    background-color: #ff9800;
-                    border-color: #f57c00;
-                    color: white;
-                }
-            """
-        else:  # idle
-            return base_style + """
-                QPushButton {
-                    background-color: #e0e0e0;
-                    border-color: #bdbdbd;
-                    color: black;
-                }
-            """
+        """Get stylesheet for the given status (unknown statuses show as idle)."""
+        return self._STYLES.get(status, self._STYLES["idle"])
 
 class InstrumentTestGUI(QMainWindow):
     """
@@ -863,16 +1046,65 @@ class InstrumentTestGUI(QMainWindow):
     Provides comprehensive testing interface with visual feedback.
     """
 
+    # Results row status styling, built once rather than per result
+    _PASS_BRUSH = QBrush(QColor(0, 128, 0))
+    _FAIL_BRUSH = QBrush(QColor(200, 0, 0))
+    _PASS_TEXT = "PASS"
+    _FAIL_TEXT = "FAIL"
+
     def __init__(self):
         super().__init__()
+        # Latest result per test name, so bounded by the set of test buttons;
+        # never key this by timestamp or run
         self.test_results = {}
+        # Pass/fail counts over test_results, kept current in on_test_completed
+        self._passed = 0
+        self._failed = 0
         self.test_buttons = {}
         self.siggen_buttons = {}  # New dictionary for SigGen buttons
-        self.tester = None
+        self.tester = None  # InstrumentTester, created once the UI exists
         self.siggen_worker = None  # Worker for SigGen operations
+        self.resource_lister = None  # Worker for VISA resource discovery
+        self._resource_cache = None  # (time.monotonic() of listing, resources)
+        # Results arriving within one flush window are shown together
+        self._results_flush_pending = False
+        self._pending_results = {}  # test name -> latest unshown result
+        self._row_items = {}  # test name -> results tree row
+        # Log lines wait here until the log timer writes them to the display;
+        # anything beyond LOG_MAX_LINES would be dropped by the view anyway
+        self._log_buffer = deque(maxlen=LOG_MAX_LINES)
+        self._ts_cache = ("", 0)  # (formatted "%H:%M:%S", epoch second)
         self.init_ui()
         self.setup_logging()
 
+        # The test set is fixed once the UI is built
+        self._test_names: Tuple[str, ...] = tuple(self.test_buttons.keys())
+        self._test_button_list: Tuple[TestButton, ...] = tuple(self.test_buttons.values())
+
+        # One long-lived test worker; signals are connected once here and
+        # each run re-targets it with reset(). Connecting once means no
+        # duplicate connections, so Qt.UniqueConnection is not needed.
+        self.tester = InstrumentTester(self.address_combo.currentText().strip())
+        queued = Qt.QueuedConnection
+        self.tester.test_completed.connect(self.on_test_completed, queued)
+        self.tester.test_started.connect(self.on_test_started, queued)
+        self.tester.progress_updated.connect(self.on_progress_updated, queued)
+        self.tester.log_message.connect(self.log_message, queued)
+        self.tester.tests_finished.connect(self.on_all_tests_finished, queued)
+        self.tester.start()
+
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(75)
+
+        # Progress bar and status bar changes are applied at ~30 Hz
+        self._pending_progress = -1  # -1 when nothing is pending
+        self._pending_status = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._apply_progress)
+        self._progress_timer.start()
+
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("Agilent/Keysight Instrument Test Suite")
@@ -1145,6 +1377,7 @@ class InstrumentTestGUI(QMainWindow):
         self.siggen_status_text = QTextEdit()
         self.siggen_status_text.setMaximumHeight(150)
         self.siggen_status_text.setReadOnly(True)
+        self.siggen_status_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         self.siggen_status_text.setFont(QFont("Consolas", 9))
         self.siggen_status_text.setPlainText("Signal Generator Ready\nSet frequency and power, then control RF output")
         status_layout.addWidget(self.siggen_status_text)
@@ -1185,10 +1418,13 @@ class InstrumentTestGUI(QMainWindow):
         layout.addLayout(summary_layout)
 
         # Results display
-        self.results_text = QTextEdit()
-        self.results_text.setReadOnly(True)
-        self.results_text.setFont(QFont("Consolas", 9))
-        layout.addWidget(self.results_text)
+        # One row per test, updated in place as results arrive
+        self.results_tree = QTreeWidget()
+        self.results_tree.setHeaderLabels(["Test", "Status", "Duration (s)", "Time", "Message"])
+        self.results_tree.setRootIsDecorated(False)
+        self.results_tree.setUniformRowHeights(True)
+        self.results_tree.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.results_tree)
 
         return widget
 
@@ -1207,24 +1443,37 @@ class InstrumentTestGUI(QMainWindow):
         log_controls.addStretch()
         layout.addLayout(log_controls)
 
-        # Log display
-        self.log_text = QTextEdit()
+        # Log display, plain text and capped so long sessions stay fast
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_text.setFont(QFont("Consolas", 9))
         layout.addWidget(self.log_text)
 
         return widget
 
     def setup_logging(self):
-        """Set up logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('instrument_test.log')
-            ]
-        )
+        """
+        Set up logging configuration.
+        Records are only queued on the calling thread; a QueueListener thread
+        writes them to the console and log file.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.StreamHandler(),
+            logging.FileHandler('instrument_test.log')
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(QueueHandler(log_queue))
+
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
 
     # NEW SIGGEN METHODS
     def turn_on_rf(self):
@@ -1233,6 +1482,10 @@ class InstrumentTestGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "SigGen operation already in progress!")
             return
 
+        if self.tester.is_busy():
+            QMessageBox.warning(self, "Warning", "Tests are already running!")
+            return
+
         address = self.address_combo.currentText().strip()
         if not address:
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
@@ -1245,7 +1498,9 @@ class InstrumentTestGUI(QMainWindow):
         self.siggen_buttons["RF Power ON"].set_status("running")
 
         # Create worker thread
+        self.tester.release_session()
         self.siggen_worker = SignalGeneratorWorker(address, "RF Power ON",
+                                                 io_lock=self.tester.io_lock,
                                                  frequency=frequency, power=power)
         self.siggen_worker.operation_completed.connect(self.on_siggen_operation_completed)
         self.siggen_worker.operation_started.connect(self.on_siggen_operation_started)
@@ -1260,6 +1515,10 @@ class InstrumentTestGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "SigGen operation already in progress!")
             return
 
+        if self.tester.is_busy():
+            QMessageBox.warning(self, "Warning", "Tests are already running!")
+            return
+
         address = self.address_combo.currentText().strip()
         if not address:
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
@@ -1268,7 +1527,9 @@ class InstrumentTestGUI(QMainWindow):
         self.siggen_buttons["RF Power OFF"].set_status("running")
 
         # Create worker thread
-        self.siggen_worker = SignalGeneratorWorker(address, "RF Power OFF")
+        self.tester.release_session()
+        self.siggen_worker = SignalGeneratorWorker(address, "RF Power OFF",
+                                                 io_lock=self.tester.io_lock)
         self.siggen_worker.operation_completed.connect(self.on_siggen_operation_completed)
         self.siggen_worker.operation_started.connect(self.on_siggen_operation_started)
         self.siggen_worker.log_message.connect(self.log_message)
@@ -1282,6 +1543,10 @@ class InstrumentTestGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "SigGen operation already in progress!")
             return
 
+        if self.tester.is_busy():
+            QMessageBox.warning(self, "Warning", "Tests are already running!")
+            return
+
         address = self.address_combo.currentText().strip()
         if not address:
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
@@ -1290,7 +1555,9 @@ class InstrumentTestGUI(QMainWindow):
         self.siggen_buttons["Device ON"].set_status("running")
 
         # Create worker thread
-        self.siggen_worker = SignalGeneratorWorker(address, "Device ON")
+        self.tester.release_session()
+        self.siggen_worker = SignalGeneratorWorker(address, "Device ON",
+                                                 io_lock=self.tester.io_lock)
         self.siggen_worker.operation_completed.connect(self.on_siggen_operation_completed)
         self.siggen_worker.operation_started.connect(self.on_siggen_operation_started)
         self.siggen_worker.log_message.connect(self.log_message)
@@ -1304,6 +1571,10 @@ class InstrumentTestGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "SigGen operation already in progress!")
             return
 
+        if self.tester.is_busy():
+            QMessageBox.warning(self, "Warning", "Tests are already running!")
+            return
+
         address = self.address_combo.currentText().strip()
         if not address:
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
@@ -1312,7 +1583,9 @@ class InstrumentTestGUI(QMainWindow):
         self.siggen_buttons["Device OFF"].set_status("running")
 
         # Create worker thread
-        self.siggen_worker = SignalGeneratorWorker(address, "Device OFF")
+        self.tester.release_session()
+        self.siggen_worker = SignalGeneratorWorker(address, "Device OFF",
+                                                 io_lock=self.tester.io_lock)
         self.siggen_worker.operation_completed.connect(self.on_siggen_operation_completed)
         self.siggen_worker.operation_started.connect(self.on_siggen_operation_started)
         self.siggen_worker.log_message.connect(self.log_message)
@@ -1348,43 +1621,60 @@ class InstrumentTestGUI(QMainWindow):
     # EXISTING METHODS (unchanged)
     def refresh_instruments(self):
         """Refresh the list of available instruments."""
-        try:
-            rm = pyvisa.ResourceManager()
-            resources = rm.list_resources()
-            rm.close()
+        if self._resource_cache is not None:
+            listed_at, resources = self._resource_cache
+            if time.monotonic() - listed_at < RESOURCE_CACHE_TTL:
+                self._show_resources(resources)
+                return
 
-            self.address_combo.clear()
-            self.address_combo.addItems(resources)
-
-            if resources:
-                self.log_message(f"Found {len(resources)} instruments: {', '.join(resources)}")
-            else:
-                self.log_message("No instruments found")
+        if self.resource_lister and self.resource_lister.isRunning():
+            return
 
-        except Exception as e:
-            self.log_message(f"Error refreshing instruments: {str(e)}")
-            QMessageBox.warning(self, "Warning", f"Failed to refresh instruments:\n{str(e)}")
+        # List resources in the background; the button stays disabled until done
+        self.refresh_btn.setEnabled(False)
+        self.resource_lister = ResourceListerThread()
+        self.resource_lister.found.connect(self.on_resources_found)
+        self.resource_lister.failed.connect(self.on_resources_failed)
+        self.resource_lister.finished.connect(lambda: self.refresh_btn.setEnabled(True))
+        self.resource_lister.start()
+
+    def on_resources_found(self, resources: List[str]):
+        """Handle a completed VISA resource listing."""
+        self._resource_cache = (time.monotonic(), resources)
+        self._show_resources(resources)
+
+    def on_resources_failed(self, error: str):
+        """Handle a failed VISA resource listing."""
+        self.log_message(f"Error refreshing instruments: {error}")
+        QMessageBox.warning(self, "Warning", f"Failed to refresh instruments:\n{error}")
+
+    def _show_resources(self, resources: List[str]):
+        """Populate the address list with the given resources."""
+        self.address_combo.clear()
+        self.address_combo.addItems(resources)
+
+        if resources:
+            self.log_message(f"Found {len(resources)} instruments: {', '.join(resources)}")
+        else:
+            self.log_message("No instruments found")
 
     def run_single_test(self, test_name: str):
         """Run a single test."""
-        if self.tester and self.tester.isRunning():
-            QMessageBox.warning(self, "Warning", "Tests are already running!")
-            return
-
         address = self.address_combo.currentText().strip()
         if not address:
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
             return
 
-        self.test_buttons[test_name].set_status("running")
+        # Switching instruments mid-run would drop or redirect queued tests
+        if address != self.tester.resource_address and self.tester.is_busy():
+            QMessageBox.warning(self, "Warning", "Tests are already running!")
+            return
 
-        self.tester = InstrumentTester(address)
-        self.tester.test_completed.connect(self.on_test_completed)
-        self.tester.test_started.connect(self.on_test_started)
-        self.tester.log_message.connect(self.log_message)
+        self.test_buttons[test_name].set_status("running")
+        self.stop_btn.setEnabled(True)
 
+        self.tester.set_address(address)
         self.tester.add_test(test_name)
-        self.tester.start()
 
     def run_all_tests(self):
         """Run all available tests."""
@@ -1393,49 +1683,39 @@ class InstrumentTestGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please enter a VISA address!")
             return
 
-        if self.tester and self.tester.isRunning():
+        if self.tester.is_busy():
             QMessageBox.warning(self, "Warning", "Tests are already running!")
             return
 
         # Reset all button states
-        for btn in self.test_buttons.values():
+        for btn in self._test_button_list:
             btn.set_status("idle")
 
-        # Create tester and connect signals
-        self.tester = InstrumentTester(address)
-        self.tester.test_completed.connect(self.on_test_completed)
-        self.tester.test_started.connect(self.on_test_started)
-        self.tester.progress_updated.connect(self.on_progress_updated)
-        self.tester.log_message.connect(self.log_message)
-        self.tester.finished.connect(self.on_all_tests_finished)
-
-        # Add all tests
-        for test_name in self.test_buttons.keys():
-            self.tester.add_test(test_name)
-
         # Update UI state
         self.run_all_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
+        self._pending_progress = -1
         self.progress_bar.setValue(0)
 
-        # Start testing
-        self.tester.start()
+        # Queue all tests
+        self.tester.reset(address, self._test_names)
+
         self.log_message(f"Starting all tests on {address}")
 
     def stop_tests(self):
         """Stop running tests."""
-        if self.tester and self.tester.isRunning():
-            self.tester.terminate()
-            self.tester.wait()
+        if self.tester.is_busy():
+            # Queued tests are dropped and the test in progress skips its
+            # remaining pauses; the worker reports tests_finished after it
+            self.tester.cancel()
             self.log_message("Tests stopped by user")
-            self.on_all_tests_finished()
 
     def on_test_started(self, test_name: str):
         """Handle test started signal."""
         if test_name in self.test_buttons:
             self.test_buttons[test_name].set_status("running")
-        self.statusBar().showMessage(f"Running: {test_name}")
+        self._pending_status = f"Running: {test_name}"
         self.log_message(f"Started test: {test_name}")
 
     def on_test_completed(self, result: TestResult):
@@ -1445,77 +1725,111 @@ class InstrumentTestGUI(QMainWindow):
             status = "pass" if result.passed else "fail"
             self.test_buttons[result.test_name].set_status(status)
 
-        # Store result
+        # Store result, moving the running counts off any previous result
+        previous = self.test_results.get(result.test_name)
+        if previous is not None:
+            if previous.passed:
+                self._passed -= 1
+            else:
+                self._failed -= 1
+        if result.passed:
+            self._passed += 1
+        else:
+            self._failed += 1
         self.test_results[result.test_name] = result
 
         # Update results display
-        self.update_results_display()
+        self._pending_results[result.test_name] = result
+        self._schedule_results_flush()
 
         # Log result
         status = "PASSED" if result.passed else "FAILED"
         self.log_message(f"Test {result.test_name}: {status} - {result.message} ({result.execution_time:.3f}s)")
 
-    def on_progress_updated(self, progress: int):
-        """Handle progress update signal."""
-        self.progress_bar.setValue(progress)
+    def _schedule_results_flush(self):
+        """Update the results display once for all results in the next 50 ms."""
+        if not self._results_flush_pending:
+            self._results_flush_pending = True
+            QTimer.singleShot(50, self._flush_results)
+
+    def _flush_results(self):
+        """Show all results received since the last flush."""
+        self._results_flush_pending = False
+        self.results_tree.setUpdatesEnabled(False)
+        for result in self._pending_results.values():
+            self._update_result_row(result)
+        self._pending_results.clear()
+        self.results_tree.setUpdatesEnabled(True)
+        self.update_results_display()
 
-    def on_all_tests_finished(self):
+    def on_progress_updated(self, progress: int):
+        """Handle progress update signal; the value is shown by _apply_progress."""
+        self._pending_progress = progress
+
+    def _apply_progress(self):
+        """Show the latest pending progress value and status bar message."""
+        if self._pending_progress >= 0:
+            if self._pending_progress != self.progress_bar.value():
+                self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = -1
+        if self._pending_status is not None:
+            self.statusBar().showMessage(self._pending_status)
+            self._pending_status = None
+
+    def on_all_tests_finished(self, summary: TestRunSummary):
         """Handle all tests finished."""
         self.run_all_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
+        self._pending_progress = -1
+        self._pending_status = None
         self.statusBar().showMessage("Tests completed")
 
-        # Show summary
-        passed = sum(1 for r in self.test_results.values() if r.passed)
-        total = len(self.test_results)
-        failed = total - passed
-        self.log_message(f"All tests completed. Passed: {passed}, Failed: {failed}, Total: {total}")
+        # Show summary of the run reported by the worker
+        self.log_message(f"All tests completed. Passed: {summary.passed}, "
+                         f"Failed: {summary.failed}, Total: {summary.total} "
+                         f"({summary.duration:.3f}s)")
+        self._flush_log()
 
     def update_results_display(self):
-        """Update the results display tab."""
-        # Update summary
-        passed = sum(1 for r in self.test_results.values() if r.passed)
-        failed = sum(1 for r in self.test_results.values() if not r.passed)
-        total = len(self.test_results)
-
-        self.passed_label.setText(f"Passed: {passed}")
-        self.failed_label.setText(f"Failed: {failed}")
-        self.total_label.setText(f"Total: {total}")
-
-        # Update detailed results
-        results_html = ""
-        results_html += "<h3>Test Results Summary</h3>"
-        results_html += f"<p><b>Total Tests:</b> {total} | <span style='color: green;'><b>Passed:</b> {passed}</span> | <span style='color: red;'><b>Failed:</b> {failed}</span></p>"
-
-        if self.test_results:
-            results_html += "<h4>Detailed Results:</h4>"
-            results_html += "<table border='1' cellpadding='3' cellspacing='0'>"
-            results_html += "<tr><th>Test Name</th><th>Status</th><th>Message</th><th>Time (s)</th><th>Timestamp</th></tr>"
-
-            for result in sorted(self.test_results.values(), key=lambda x: x.timestamp, reverse=True):
-                status_color = "green" if result.passed else "red"
-                status_text = "PASS" if result.passed else "FAIL"
-
-                results_html += f"<tr>"
-                results_html += f"<td><b>{result.test_name}</b></td>"
-                results_html += f"<td style='color: {status_color};'><b>{status_text}</b></td>"
-                results_html += f"<td>{result.message}</td>"
-                results_html += f"<td>{result.execution_time:.3f}</td>"
-                results_html += f"<td>{result.timestamp.strftime('%H:%M:%S')}</td>"
-                results_html += f"</tr>"
-
-            results_html += "</table>"
-
-        self.results_text.setHtml(results_html)
+        """Update the results summary counts."""
+        self.passed_label.setText(f"Passed: {self._passed}")
+        self.failed_label.setText(f"Failed: {self._failed}")
+        self.total_label.setText(f"Total: {len(self.test_results)}")
+
+    def _update_result_row(self, result: TestResult):
+        """Show result in its test's row, moving the row to the top."""
+        item = self._row_items.get(result.test_name)
+        if item is None:
+            item = QTreeWidgetItem()
+            self._row_items[result.test_name] = item
+        else:
+            self.results_tree.takeTopLevelItem(self.results_tree.indexOfTopLevelItem(item))
+        # Most recent result first
+        self.results_tree.insertTopLevelItem(0, item)
+
+        item.setText(0, result.test_name)
+        if result.passed:
+            item.setText(1, self._PASS_TEXT)
+            item.setForeground(1, self._PASS_BRUSH)
+        else:
+            item.setText(1, self._FAIL_TEXT)
+            item.setForeground(1, self._FAIL_BRUSH)
+        item.setText(2, f"{result.execution_time:.3f}")
+        item.setText(3, result.timestamp.strftime('%H:%M:%S'))
+        item.setText(4, result.message)
 
     def clear_results(self):
         """Clear all test results."""
         self.test_results.clear()
-        self.results_text.clear()
+        self._passed = 0
+        self._failed = 0
+        self._pending_results.clear()
+        self._row_items.clear()
+        self.results_tree.clear()
 
         # Reset all button states
-        for btn in self.test_buttons.values():
+        for btn in self._test_button_list:
             btn.set_status("idle")
         for btn in self.siggen_buttons.values():
             btn.set_status("idle")
@@ -1532,19 +1846,46 @@ class InstrumentTestGUI(QMainWindow):
 
     def log_message(self, message: str):
         """Add a message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        # Timestamps have one-second resolution, so format once per second
+        now = int(time.time())
+        if now != self._ts_cache[1]:
+            self._ts_cache = (time.strftime("%H:%M:%S", time.localtime(now)), now)
+        log_entry = f"[{self._ts_cache[0]}] {message}"
 
-        self.log_text.append(log_entry)
+        # Buffer for the display; the log timer appends buffered lines together
+        self._log_buffer.append(log_entry)
 
-        # Also log to console and file
-        print(log_entry)
+        # Console and file output is written by the QueueListener thread
         logging.info(message)
 
-        # Auto-scroll to bottom
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.log_text.setTextCursor(cursor)
+    def _flush_log(self):
+        """Append all buffered log lines to the log display in one update."""
+        if not self._log_buffer:
+            return
+        entries = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        self.log_text.setUpdatesEnabled(False)
+        with QSignalBlocker(self.log_text):
+            self.log_text.appendPlainText(entries)
+
+        # Auto-scroll to bottom without moving the text cursor
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        self.log_text.setUpdatesEnabled(True)
+        self.log_text.viewport().update()
+
+    def closeEvent(self, event):
+        """Shut down the worker threads before the window closes."""
+        self._log_timer.stop()
+        self._progress_timer.stop()
+        self._flush_log()
+        self.tester.stop()
+        self.tester.wait()
+        if self.resource_lister:
+            self.resource_lister.wait()
+        self._log_listener.stop()
+        super().closeEvent(event)
 
 
 def main():
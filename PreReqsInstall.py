@@ -51,7 +51,26 @@ import subprocess
 import sys
 import os
 
+# Used to skip requirements that are already installed; without them
+# (Python < 3.8 or no packaging module) everything is handed to pip
+try:
+    from importlib.metadata import version, PackageNotFoundError
+    from packaging.requirements import Requirement
+except ImportError:
+    Requirement = None
+
 # %% Functions Defs
+def requirement_satisfied(requirement):
+    """Return True if an installed distribution already meets requirement."""
+    if Requirement is None:
+        return False
+
+    req = Requirement(requirement)
+    try:
+        return req.specifier.contains(version(req.name), prereleases=True)
+    except PackageNotFoundError:
+        return False
+
 def install_requirements():
     """Install required Python packages."""
 
@@ -62,15 +81,27 @@ def install_requirements():
         "pyvisa-py>=0.5.0"  # Pure Python VISA implementation
     ]
 
-    print("Installing required packages...")
+    missing = []
     for package in requirements:
-        try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"✓ {package} installed successfully")
-        except subprocess.CalledProcessError:
-            print(f"✗ Failed to install {package}")
-            return False
+        if requirement_satisfied(package):
+            print(f"✓ {package} already installed")
+        else:
+            missing.append(package)
+
+    if not missing:
+        return True
+
+    print("Installing required packages...")
+    # One pip run resolves and downloads everything in a single pass
+    try:
+        print(f"Installing {', '.join(missing)}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+    except subprocess.CalledProcessError:
+        print(f"✗ Failed to install {', '.join(missing)}")
+        return False
+
+    for package in missing:
+        print(f"✓ {package} installed successfully")
 
     return True
 